@@ -0,0 +1,42 @@
+import os
+import tempfile
+import time
+
+from target_repo.src.utils.analytics import AnalyticsEngine
+
+N = 200_000
+
+def events(n: int):
+    return [(f"event_{i % 10}", {"i": i}) for i in range(n)]
+
+def rate(label: str, seconds: float, n: int):
+    print(f"{label:<28} {n / seconds:>14,.0f} events/sec")
+
+def main():
+    batch = events(N)
+
+    engine = AnalyticsEngine()
+    start = time.perf_counter()
+    for name, props in batch:
+        engine.track_event(name, props)
+    rate("track_event (list)", time.perf_counter() - start, N)
+
+    engine = AnalyticsEngine()
+    start = time.perf_counter()
+    engine.track_events(batch)
+    rate("track_events (list)", time.perf_counter() - start, N)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = AnalyticsEngine(segment_path=os.path.join(tmp, "events.seg"))
+        start = time.perf_counter()
+        engine.track_events(batch)
+        rate("track_events (segment)", time.perf_counter() - start, N)
+
+        start = time.perf_counter()
+        matched = sum(1 for _ in engine.iter_events("event_3"))
+        rate("iter_events (segment scan)", time.perf_counter() - start, N)
+        assert matched == N // 10
+
+
+if __name__ == "__main__":
+    main()
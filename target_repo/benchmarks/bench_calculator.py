@@ -0,0 +1,30 @@
+import random
+import time
+
+from target_repo.src.domain.models import Item, ItemBatch
+from target_repo.src.service.calculator import Calculator
+
+N = 1_000_000
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - start:>8.3f} s")
+    return result
+
+def main():
+    rng = random.Random(0)
+    items = [Item(f"sku_{i % 100}", rng.uniform(1, 100), rng.randint(1, 10)) for i in range(N)]
+    batch = ItemBatch.from_items(items)
+    calc = Calculator()
+
+    scalar = timed("calculate_total (items)", lambda: calc.calculate_total(items))
+    columnar = timed("calculate_batch_total", lambda: calc.calculate_batch_total(batch))
+    assert abs(scalar - columnar) <= 1e-6 * abs(scalar)
+
+    timed("calculate_subtotals", lambda: calc.calculate_subtotals(batch))
+    timed("divide_batch", lambda: calc.divide_batch(batch.prices, batch.quantities))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import random
+import time
+
+from target_repo.src.utils.helpers import format_currencies, format_currency, parse_int, parse_ints
+
+N = 500_000
+
+def rate(label: str, seconds: float, n: int):
+    print(f"{label:<32} {n / seconds:>14,.0f} values/sec")
+
+def main():
+    rng = random.Random(0)
+    for invalid_ratio in (0.0, 0.1, 0.5, 0.9):
+        values = [
+            f"n/a{i}" if rng.random() < invalid_ratio else str(rng.randint(-10**6, 10**6))
+            for i in range(N)
+        ]
+        start = time.perf_counter()
+        scalar = [parse_int(v) for v in values]
+        rate(f"parse_int loop ({invalid_ratio:.0%} invalid)", time.perf_counter() - start, N)
+        start = time.perf_counter()
+        columnar = parse_ints(values)
+        rate(f"parse_ints ({invalid_ratio:.0%} invalid)", time.perf_counter() - start, N)
+        assert scalar == columnar
+
+    amounts = [rng.uniform(-10**6, 10**6) for _ in range(N)]
+    start = time.perf_counter()
+    scalar = [format_currency(a) for a in amounts]
+    rate("format_currency loop", time.perf_counter() - start, N)
+    start = time.perf_counter()
+    columnar = format_currencies(amounts)
+    rate("format_currencies", time.perf_counter() - start, N)
+    assert scalar == columnar
+
+
+if __name__ == "__main__":
+    main()
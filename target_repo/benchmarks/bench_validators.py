@@ -0,0 +1,56 @@
+import csv
+import os
+import random
+import tempfile
+import time
+
+from target_repo.src.utils.validators import (
+    validate_csv_column,
+    validate_email,
+    validate_emails,
+    validate_phone,
+    validate_phones,
+)
+
+N = 500_000
+
+def rate(label: str, seconds: float, n: int):
+    print(f"{label:<32} {n / seconds:>14,.0f} rows/sec")
+
+def main():
+    rng = random.Random(0)
+    emails = [f"user{i}@example.com" if rng.random() < 0.9 else f"bad{i}" for i in range(N)]
+    phones = [f"+1 (555) {rng.randint(0, 10**7):07d}" if rng.random() < 0.9 else "123" for _ in range(N)]
+
+    start = time.perf_counter()
+    scalar = [validate_email(e) for e in emails]
+    rate("validate_email (loop)", time.perf_counter() - start, N)
+    start = time.perf_counter()
+    mask = validate_emails(emails)
+    rate("validate_emails", time.perf_counter() - start, N)
+    assert list(map(bool, mask)) == scalar
+
+    start = time.perf_counter()
+    scalar = [validate_phone(p) for p in phones]
+    rate("validate_phone (loop)", time.perf_counter() - start, N)
+    start = time.perf_counter()
+    mask = validate_phones(phones)
+    rate("validate_phones", time.perf_counter() - start, N)
+    assert list(map(bool, mask)) == scalar
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "contacts.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["email", "phone"])
+            writer.writerows(zip(emails, phones))
+
+        for workers in (1, 2, 4):
+            start = time.perf_counter()
+            invalid = validate_csv_column(path, "phone", "phone", workers=workers)
+            rate(f"validate_csv_column workers={workers}", time.perf_counter() - start, N)
+            assert len(invalid) == mask.count(0)
+
+
+if __name__ == "__main__":
+    main()
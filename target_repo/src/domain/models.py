@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: str
     price: float
@@ -8,3 +10,42 @@ class Item:
 
     def total_cost(self) -> float:
         return self.price * self.quantity
+
+@dataclass(slots=True)
+class ItemBatch:
+    # Columnar storage: one compact typed array per numeric field instead of
+    # one Item object per row.
+    names: list[str] = field(default_factory=list)
+    prices: array = field(default_factory=lambda: array("d"))
+    quantities: array = field(default_factory=lambda: array("q"))
+
+    def __post_init__(self):
+        if not isinstance(self.prices, array) or self.prices.typecode != "d":
+            self.prices = array("d", self.prices)
+        if not isinstance(self.quantities, array) or self.quantities.typecode != "q":
+            self.quantities = array("q", self.quantities)
+        if not len(self.names) == len(self.prices) == len(self.quantities):
+            raise ValueError("ItemBatch columns must have the same length")
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "ItemBatch":
+        batch = cls()
+        for item in items:
+            batch.append(item)
+        return batch
+
+    def append(self, item: Item):
+        self.names.append(item.name)
+        self.prices.append(item.price)
+        self.quantities.append(item.quantity)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int | slice) -> "Item | ItemBatch":
+        if isinstance(index, slice):
+            return ItemBatch(self.names[index], self.prices[index], self.quantities[index])
+        return Item(self.names[index], self.prices[index], self.quantities[index])
+
+    def __iter__(self) -> Iterator[Item]:
+        return map(Item, self.names, self.prices, self.quantities)
@@ -1,4 +1,26 @@
-from target_repo.src.domain.models import Item
+import math
+import operator
+from array import array
+from collections import defaultdict
+from typing import Sequence
+
+from target_repo.src.domain.models import Item, ItemBatch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch methods fall back to array/map
+    np = None
+
+def _as_column(values: Sequence[float]):
+    if isinstance(values, array) and values.typecode == "d":
+        return np.frombuffer(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+def _to_array(values) -> array:
+    result = array("d")
+    # array.frombytes only takes byte-format buffers; cast the view, no copy.
+    result.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.float64)).cast("B"))
+    return result
 
 class Calculator:
     def add(self, a: float, b: float) -> float:
@@ -20,3 +42,53 @@ class Calculator:
         for item in items:
             total += item.total_cost()
         return total
+
+    def calculate_batch_total(self, batch: ItemBatch) -> float:
+        if np is not None:
+            prices = np.frombuffer(batch.prices, dtype=np.float64)
+            quantities = np.frombuffer(batch.quantities, dtype=np.int64)
+            return float(np.dot(prices, quantities))
+        return float(math.sumprod(batch.prices, batch.quantities))
+
+    def calculate_subtotals(self, batch: ItemBatch) -> dict[str, float]:
+        if np is not None:
+            # Factorize names through a dict (np.unique over a str column is
+            # slower than the plain loop), then sum per group with bincount.
+            codes = dict.fromkeys(batch.names)
+            for code, name in enumerate(codes):
+                codes[name] = code
+            groups = np.fromiter(map(codes.__getitem__, batch.names), dtype=np.intp, count=len(batch))
+            prices = np.frombuffer(batch.prices, dtype=np.float64)
+            quantities = np.frombuffer(batch.quantities, dtype=np.int64)
+            sums = np.bincount(groups, weights=prices * quantities, minlength=len(codes))
+            return dict(zip(codes, sums.tolist()))
+        # Without NumPy the stdlib has no weighted group-by, so this path is
+        # intentionally a per-item loop.
+        subtotals = defaultdict(float)
+        for name, cost in zip(batch.names, map(operator.mul, batch.prices, batch.quantities)):
+            subtotals[name] += cost
+        return dict(subtotals)
+
+    def add_batch(self, a: Sequence[float], b: Sequence[float]) -> array:
+        return self._elementwise(operator.add, a, b)
+
+    def subtract_batch(self, a: Sequence[float], b: Sequence[float]) -> array:
+        return self._elementwise(operator.sub, a, b)
+
+    def multiply_batch(self, a: Sequence[float], b: Sequence[float]) -> array:
+        return self._elementwise(operator.mul, a, b)
+
+    def divide_batch(self, a: Sequence[float], b: Sequence[float]) -> array:
+        return self._elementwise(operator.truediv, a, b)
+
+    def _elementwise(self, op, a: Sequence[float], b: Sequence[float]) -> array:
+        if len(a) != len(b):
+            raise ValueError("Batch operands must have the same length")
+        # Check the whole divisor column at once, matching divide()'s error.
+        # This runs before any NumPy views exist, so a kept traceback cannot
+        # pin the caller's array buffers.
+        if op is operator.truediv and 0 in b:
+            raise ValueError("Cannot divide by zero")
+        if np is not None:
+            return _to_array(op(_as_column(a), _as_column(b)))
+        return array("d", map(op, a, b))
@@ -1,16 +1,109 @@
-from typing import List
+import json
+import mmap
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_COPY_CHUNK_SIZE = 1 << 20
+
+def _find_record(mm: mmap.mmap, needle: bytes, pos: int) -> int:
+    # needle is b"\n" + prefix; return the start of the matching record.
+    index = mm.find(needle, pos)
+    return index + 1 if index != -1 else -1
 
 class AnalyticsEngine:
-    def __init__(self):
+    def __init__(self, segment_path: Optional[str] = None):
+        # With a segment_path, events go to an append-only log on disk
+        # instead of self.data, so they survive restarts. Properties are
+        # stored as JSON: int keys come back as strings, tuples as lists, and
+        # values JSON cannot encode raise TypeError.
         self.data = []
+        self.segment_path = segment_path
 
     def track_event(self, event_name: str, properties: dict = None):
+        if self.segment_path is not None:
+            self.track_events([(event_name, properties)])
+            return
         if not event_name:
             raise ValueError("Event name cannot be empty")
         self.data.append({"name": event_name, "properties": properties or {}})
 
+    def track_events(self, events: Iterable[Tuple[str, Optional[dict]]]):
+        batch = []
+        for event_name, properties in events:
+            if not event_name:
+                raise ValueError("Event name cannot be empty")
+            batch.append({"name": event_name, "properties": properties or {}})
+
+        if self.segment_path is None:
+            self.data.extend(batch)
+            return
+
+        # One record per line: JSON-encoded name, a tab, JSON-encoded properties.
+        # JSON escapes tabs and newlines, so neither appears inside a field.
+        records = b"".join(
+            json.dumps(e["name"]).encode() + b"\t" + json.dumps(e["properties"]).encode() + b"\n"
+            for e in batch
+        )
+        with open(self.segment_path, "a+b") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+            else:
+                torn = False
+            if not torn:
+                f.write(records)
+                return
+            # A crash mid-write left a partial last record. Drop it in a new
+            # file so readers holding a map of the old one are unaffected.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                keep = mm.rfind(b"\n") + 1
+        self._replace_segment(keep, records)
+
+    def iter_events(self, event_name: str) -> Iterator[dict]:
+        if self.segment_path is None:
+            for e in self.data:
+                if e["name"] == event_name:
+                    yield e
+            return
+
+        if not os.path.exists(self.segment_path) or os.path.getsize(self.segment_path) == 0:
+            return
+
+        # Search for the encoded name prefix at line starts, so the scan jumps
+        # from match to match and non-matching records are never decoded.
+        # A final record without a newline is a torn write and is skipped.
+        prefix = json.dumps(event_name).encode() + b"\t"
+        needle = b"\n" + prefix
+        with open(self.segment_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0 if mm[:len(prefix)] == prefix else _find_record(mm, needle, 0)
+                while start != -1:
+                    end = mm.find(b"\n", start + len(prefix))
+                    if end == -1:
+                        break
+                    properties = json.loads(mm[start + len(prefix):end])
+                    yield {"name": event_name, "properties": properties}
+                    start = _find_record(mm, needle, end)
+
     def get_events(self, event_name: str) -> List[dict]:
-        return [e for e in self.data if e["name"] == event_name]
+        return list(self.iter_events(event_name))
 
     def clear(self):
         self.data = []
+        if self.segment_path is not None and os.path.exists(self.segment_path):
+            self._replace_segment(0)
+
+    def _replace_segment(self, keep: int, records: bytes = b""):
+        # Swap in a new file rather than truncating in place: open maps keep
+        # the old inode, so iterating readers never touch released pages.
+        # The first `keep` bytes are streamed across, never read into memory.
+        tmp_path = self.segment_path + ".tmp"
+        with open(self.segment_path, "rb") as src, open(tmp_path, "wb") as dst:
+            while keep > 0:
+                chunk = src.read(min(keep, _COPY_CHUNK_SIZE))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                keep -= len(chunk)
+            dst.write(records)
+        os.replace(tmp_path, self.segment_path)
@@ -1,8 +1,88 @@
+import re
+import sys
+from itertools import islice
+from typing import Iterable
+
+# Mirrors int()'s base-10 grammar. int() strips str.isspace() characters
+# except the \x1c-\x1f separators, hence the whitespace class.
+_INT_PATTERN = re.compile(r"[^\S\x1c-\x1f]*[+-]?\d+(?:_\d+)*[^\S\x1c-\x1f]*")
+_CHUNK_SIZE = 65_536
+_PARSE_CHUNK_SIZE = 1024
+
 def format_currency(amount: float) -> str:
     return f"${amount:.2f}"
 
+def format_currencies(amounts: Iterable[float]) -> list[str]:
+    # One str.format call per chunk instead of one f-string per value.
+    result = []
+    amounts = iter(amounts)
+    while chunk := tuple(islice(amounts, _CHUNK_SIZE)):
+        result.extend(("${:.2f}\0" * len(chunk)).format(*chunk).split("\0")[:-1])
+    return result
+
 def parse_int(value: str) -> int:
     try:
         return int(value)
     except ValueError:
         return 0
+
+def _parse_ints_resuming(values: tuple, result: list) -> int:
+    # map(int) runs at C speed; list.extend keeps what it produced before a
+    # ValueError, and the shared iterator resumes after the failing value,
+    # which parse_int would have turned into 0. Returns the failure count.
+    values = iter(values)
+    invalid = 0
+    while True:
+        try:
+            result.extend(map(int, values))
+            return invalid
+        except ValueError:
+            result.append(0)
+            invalid += 1
+
+def _parse_ints_validated(values: tuple) -> list[int]:
+    # Validate-then-convert for str-only chunks: no exceptions at all.
+    match = _INT_PATTERN.fullmatch
+    limit = sys.get_int_max_str_digits() or sys.maxsize
+    return [
+        int(value)
+        if (value.isdecimal() or value[:1] in "+-" and value[1:].isdecimal() or match(value))
+        and len(value) <= limit
+        else parse_int(value) if len(value) > limit
+        else 0
+        for value in values
+    ]
+
+def _split_buffer(buffer, sep: str) -> list:
+    # ASCII input parses identically as str, so it joins the fast path;
+    # other bytes stay bytes and go through parse_int.
+    if isinstance(buffer, str):
+        fields = buffer.split(sep)
+    else:
+        buffer = bytes(buffer)
+        fields = buffer.decode("ascii").split(sep) if buffer.isascii() else buffer.split(sep.encode())
+    # A trailing separator ends the last value rather than adding an empty one.
+    if fields and not fields[-1]:
+        fields.pop()
+    return fields
+
+def parse_ints(values: Iterable[str] | str | bytes | bytearray | memoryview, sep: str = "\n") -> list[int]:
+    # str and bytes-like buffers are split on sep, one value per field.
+    if isinstance(values, (str, bytes, bytearray, memoryview)):
+        values = _split_buffer(values, sep)
+    # Each chunk converts with map(int), resuming after any invalid value.
+    # Raising costs about twice a regex check, so once a chunk turns out more
+    # than a quarter invalid, the next one is validated up front instead.
+    # Zeros stand in for the invalid count there; valid "0"s only bias the
+    # choice towards validation. Chunks holding non-str values always resume.
+    result = []
+    values = iter(values)
+    invalid = 0
+    while chunk := tuple(islice(values, _PARSE_CHUNK_SIZE)):
+        if invalid * 4 > len(chunk) and set(map(type, chunk)) == {str}:
+            converted = _parse_ints_validated(chunk)
+            result += converted
+            invalid = converted.count(0)
+        else:
+            invalid = _parse_ints_resuming(chunk, result)
+    return result